@@ -1,3 +1,22 @@
-from django.contrib import admin
+class ChangedFieldsAdminMixin:
+    """ModelAdmin mixin that only writes the columns a change form modified."""
 
-# Register your models here.
+    def save_model(self, request, obj, form, change):
+        """Save edits with update_fields so untouched columns are not rewritten."""
+        if change:
+            concrete_fields = obj._meta.concrete_fields
+            update_fields = [
+                field.name
+                for field in concrete_fields
+                if field.name in form.changed_data
+            ]
+            if update_fields:
+                # auto_now columns are never in the form but must still be bumped.
+                update_fields += [
+                    field.name
+                    for field in concrete_fields
+                    if getattr(field, "auto_now", False)
+                ]
+                obj.save(update_fields=update_fields)
+                return
+        super().save_model(request, obj, form, change)
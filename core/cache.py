@@ -0,0 +1,29 @@
+import time
+
+from django.core.cache import cache
+
+AVAILABLE_TIMESLOTS_VERSION_KEY = "timeslots:available:version"
+AVAILABLE_TIMESLOTS_TIMEOUT = 30
+
+
+def available_timeslots_key(suffix):
+    """
+    Build a cache key for one cached view of the available time slots.
+
+    Args:
+        suffix: Identifies the cached page, e.g. a hash of the request URL
+
+    Returns:
+        str: Key scoped to the current availability version
+    """
+    version = cache.get_or_set(
+        AVAILABLE_TIMESLOTS_VERSION_KEY, time.time_ns, timeout=None
+    )
+    return f"timeslots:available:{version}:{suffix}"
+
+
+def invalidate_available_timeslots():
+    """Orphan every cached availability page by moving to a new version."""
+    # A fresh timestamp rather than incr(), so an evicted version key can
+    # never be recreated with a value older entries were stored under.
+    cache.set(AVAILABLE_TIMESLOTS_VERSION_KEY, time.time_ns(), timeout=None)
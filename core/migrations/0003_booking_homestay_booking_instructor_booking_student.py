@@ -0,0 +1,44 @@
+# Generated by Django 4.2.30 on 2026-10-15 21:41
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("homestay", "0001_initial"),
+        ("core", "0002_booking_conversation_fileattachment_location_message_and_more"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="booking",
+            name="homestay",
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.CASCADE,
+                to="homestay.homestay",
+            ),
+        ),
+        migrations.AddField(
+            model_name="booking",
+            name="instructor",
+            field=models.ForeignKey(
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="bookings_as_instructor",
+                to=settings.AUTH_USER_MODEL,
+            ),
+        ),
+        migrations.AddField(
+            model_name="booking",
+            name="student",
+            field=models.ForeignKey(
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="bookings_as_student",
+                to=settings.AUTH_USER_MODEL,
+            ),
+        ),
+    ]
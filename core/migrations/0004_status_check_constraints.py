@@ -0,0 +1,22 @@
+# Generated by Django 4.2.30 on 2026-10-15 21:42
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0003_booking_homestay_booking_instructor_booking_student"),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name="booking",
+            constraint=models.CheckConstraint(
+                check=models.Q(
+                    ("status__in", ["pending", "confirmed", "cancelled", "completed"])
+                ),
+                name="booking_status_valid",
+            ),
+        ),
+    ]
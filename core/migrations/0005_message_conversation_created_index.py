@@ -0,0 +1,20 @@
+# Generated by Django 4.2.30 on 2026-10-15 21:44
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0004_status_check_constraints"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="message",
+            index=models.Index(
+                fields=["conversation", "-created_at"],
+                name="message_convers_74c031_idx",
+            ),
+        ),
+    ]
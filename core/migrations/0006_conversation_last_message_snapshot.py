@@ -0,0 +1,48 @@
+# Generated by Django 4.2.30 on 2026-10-15 21:45
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def backfill_last_message_snapshot(apps, schema_editor):
+    Conversation = apps.get_model("core", "Conversation")
+    Message = apps.get_model("core", "Message")
+    for conversation in Conversation.objects.iterator():
+        message = (
+            Message.objects.filter(conversation=conversation)
+            .order_by("-created_at")
+            .first()
+        )
+        if message:
+            Conversation.objects.filter(pk=conversation.pk).update(
+                last_message_preview=message.content[:280],
+                last_message_sender=message.sender_id,
+            )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0005_message_conversation_created_index"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="conversation",
+            name="last_message_preview",
+            field=models.CharField(blank=True, max_length=280),
+        ),
+        migrations.AddField(
+            model_name="conversation",
+            name="last_message_sender",
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="+",
+                to=settings.AUTH_USER_MODEL,
+            ),
+        ),
+        migrations.RunPython(backfill_last_message_snapshot, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 4.2.30 on 2026-10-15 21:45
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0006_conversation_last_message_snapshot"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="conversation",
+            name="last_message_at",
+            field=models.DateTimeField(default=django.utils.timezone.now),
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 4.2.30 on 2026-10-15 21:46
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0007_conversation_last_message_at_default"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="message",
+            index=models.Index(
+                fields=["conversation", "is_read", "sender"],
+                name="message_convers_92226c_idx",
+            ),
+        ),
+    ]
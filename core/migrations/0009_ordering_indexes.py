@@ -0,0 +1,37 @@
+# Generated by Django 4.2.30 on 2026-10-15 21:46
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0008_message_unread_index"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="conversation",
+            index=models.Index(
+                fields=["-last_message_at"], name="conversatio_last_me_78e563_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="notification",
+            index=models.Index(
+                fields=["user", "-created_at"], name="notificatio_user_id_366c29_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="notification",
+            index=models.Index(
+                fields=["user", "is_read"], name="notificatio_user_id_d569bc_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="timeslot",
+            index=models.Index(
+                fields=["instructor", "start_time"], name="time_slot_instruc_cc5c98_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 4.2.30 on 2026-10-15 21:49
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0009_ordering_indexes"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="message",
+            name="message_convers_74c031_idx",
+        ),
+        migrations.AddIndex(
+            model_name="message",
+            index=models.Index(
+                fields=["conversation", "-created_at", "-id"],
+                name="message_convers_f7a76e_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 4.2.30 on 2026-10-15 21:50
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0010_message_conversation_created_id_index"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="timeslot",
+            index=models.Index(
+                fields=["is_available", "start_time"],
+                name="time_slot_is_avai_ba181e_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,31 @@
+from django.db import migrations
+
+# Matches the expression Django emits for city__icontains on PostgreSQL:
+# UPPER("core_location"."city"::text) LIKE UPPER('%...%').
+CREATE_INDEX = """
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+CREATE INDEX IF NOT EXISTS core_location_city_trgm
+    ON core_location USING gin (UPPER(city::text) gin_trgm_ops);
+"""
+DROP_INDEX = "DROP INDEX IF EXISTS core_location_city_trgm;"
+
+
+def create_city_trigram_index(apps, schema_editor):
+    if schema_editor.connection.vendor == "postgresql":
+        schema_editor.execute(CREATE_INDEX)
+
+
+def drop_city_trigram_index(apps, schema_editor):
+    if schema_editor.connection.vendor == "postgresql":
+        schema_editor.execute(DROP_INDEX)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0011_role_filter_indexes"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_city_trigram_index, drop_city_trigram_index),
+    ]
@@ -4,6 +4,7 @@ from django.contrib.auth.models import (
     PermissionsMixin,
 )
 from django.db import models
+from django.db.models.functions import Lower
 from django.utils import timezone
 
 
@@ -34,6 +35,10 @@ class UserManager(BaseUserManager):
         extra_fields.setdefault("is_superuser", True)
         return self.create_user(email, password, role=Role.ADMIN, **extra_fields)
 
+    def get_by_natural_key(self, email):
+        """Look up a user by email, case-insensitively, via the lower(email) index."""
+        return self.alias(email_lower=Lower("email")).get(email_lower=email.lower())
+
 
 class User(AbstractBaseUser, PermissionsMixin):
     """Custom user model with role-based authentication."""
@@ -54,6 +59,11 @@ class User(AbstractBaseUser, PermissionsMixin):
     USERNAME_FIELD = "email"
     REQUIRED_FIELDS = ["name"]
 
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(Lower("email"), name="user_email_ci_uniq"),
+        ]
+
     def __str__(self):
         return f"{self.email} ({self.role})"
 
@@ -105,11 +115,16 @@ class Conversation(TimeStampedModel):
 
     participants = models.ManyToManyField(User, related_name="conversations")
     title = models.CharField(max_length=200, blank=True)
-    last_message_at = models.DateTimeField(auto_now=True)
+    last_message_at = models.DateTimeField(default=timezone.now)
+    # Newest message, maintained by core.signals so lists can join it.
+    last_message = models.ForeignKey(
+        "Message", on_delete=models.SET_NULL, null=True, blank=True, related_name="+"
+    )
 
     class Meta:
         db_table = "conversation"
         ordering = ["-last_message_at"]
+        indexes = [models.Index(fields=["-last_message_at"])]
 
 
 class Message(TimeStampedModel):
@@ -126,18 +141,23 @@ class Message(TimeStampedModel):
     class Meta:
         db_table = "message"
         ordering = ["created_at"]
+        indexes = [
+            models.Index(fields=["conversation", "-created_at", "-id"]),
+            models.Index(fields=["conversation", "is_read", "sender"]),
+        ]
+
+
+BOOKING_STATUS_CHOICES = (
+    ("pending", "Pending"),
+    ("confirmed", "Confirmed"),
+    ("cancelled", "Cancelled"),
+    ("completed", "Completed"),
+)
 
 
 class Booking(TimeStampedModel):
     """Booking model for lesson and homestay bookings."""
 
-    STATUS_CHOICES = (
-        ("pending", "Pending"),
-        ("confirmed", "Confirmed"),
-        ("cancelled", "Cancelled"),
-        ("completed", "Completed"),
-    )
-
     student = models.ForeignKey(
         User, on_delete=models.CASCADE, related_name="bookings_as_student"
     )
@@ -150,12 +170,22 @@ class Booking(TimeStampedModel):
 
     start_date = models.DateTimeField()
     end_date = models.DateTimeField()
-    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default="pending")
+    status = models.CharField(
+        max_length=20, choices=BOOKING_STATUS_CHOICES, default="pending"
+    )
     total_amount = models.DecimalField(max_digits=10, decimal_places=2)
     notes = models.TextField(blank=True)
 
     class Meta:
         db_table = "booking"
+        constraints = [
+            models.CheckConstraint(
+                check=models.Q(
+                    status__in=[value for value, _ in BOOKING_STATUS_CHOICES]
+                ),
+                name="booking_status_valid",
+            ),
+        ]
 
 
 class TimeSlot(TimeStampedModel):
@@ -171,6 +201,10 @@ class TimeSlot(TimeStampedModel):
 
     class Meta:
         db_table = "time_slot"
+        indexes = [
+            models.Index(fields=["instructor", "start_time"]),
+            models.Index(fields=["is_available", "start_time"]),
+        ]
 
 
 class Notification(TimeStampedModel):
@@ -196,6 +230,10 @@ class Notification(TimeStampedModel):
     class Meta:
         db_table = "notification"
         ordering = ["-created_at"]
+        indexes = [
+            models.Index(fields=["user", "-created_at"]),
+            models.Index(fields=["user", "is_read"]),
+        ]
 
 
 class NotificationPreference(TimeStampedModel):
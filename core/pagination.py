@@ -0,0 +1,22 @@
+from rest_framework.pagination import CursorPagination
+
+
+class ConversationCursorPagination(CursorPagination):
+    """Keyset pagination for the conversation inbox, most recent first."""
+
+    ordering = "-last_message_at"
+    page_size = 25
+
+
+class NotificationCursorPagination(CursorPagination):
+    """Keyset pagination for notification feeds, newest first."""
+
+    ordering = "-created_at"
+    page_size = 25
+
+
+class MessageCursorPagination(CursorPagination):
+    """Keyset pagination for a conversation's messages, newest first."""
+
+    ordering = ("-created_at", "-id")
+    page_size = 50
@@ -0,0 +1,31 @@
+import orjson
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    JSON renderer that encodes responses with orjson.
+
+    Datetimes and any type orjson does not handle natively are passed to
+    DRF's encoder, and U+2028/U+2029 are escaped as JSONRenderer does.
+    Unlike JSONRenderer, NaN and infinite floats render as null instead
+    of raising.
+    """
+
+    options = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        """Render `data` into JSON bytes."""
+        if data is None:
+            return b""
+
+        options = self.options
+        if self.get_indent(accepted_media_type, renderer_context or {}):
+            options |= orjson.OPT_INDENT_2
+        ret = orjson.dumps(data, default=JSONEncoder().default, option=options)
+        # Line and paragraph separators are valid JSON but not valid
+        # JavaScript string literals, so escape them like JSONRenderer.
+        return ret.replace(b"\xe2\x80\xa8", b"\\u2028").replace(
+            b"\xe2\x80\xa9", b"\\u2029"
+        )
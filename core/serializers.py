@@ -1,5 +1,6 @@
 from rest_framework import serializers
 from django.contrib.auth import authenticate
+from django.db.models.functions import Lower
 from .models import (
     User,
     Location,
@@ -31,6 +32,15 @@ class UserSerializer(serializers.ModelSerializer):
         read_only_fields = ["id", "date_joined"]
 
 
+class UserSummarySerializer(serializers.ModelSerializer):
+    """Compact serializer for users embedded in other resources."""
+
+    class Meta:
+        model = User
+        fields = ["id", "name", "avatar"]
+        read_only_fields = fields
+
+
 class UserRegistrationSerializer(serializers.ModelSerializer):
     """Serializer for user registration."""
 
@@ -40,6 +50,13 @@ class UserRegistrationSerializer(serializers.ModelSerializer):
         model = User
         fields = ["email", "name", "password", "role"]
 
+    def validate_email(self, value):
+        """Reject emails that differ from an existing one only by case."""
+        existing = User.objects.alias(email_lower=Lower("email"))
+        if existing.filter(email_lower=value.lower()).exists():
+            raise serializers.ValidationError("A user with this email already exists.")
+        return value
+
     def create(self, validated_data):
         """Create a new user with the provided data."""
         return User.objects.create_user(**validated_data)
@@ -72,7 +89,16 @@ class LocationSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = Location
-        fields = "__all__"
+        fields = [
+            "id",
+            "address",
+            "city",
+            "state",
+            "country",
+            "postal_code",
+            "latitude",
+            "longitude",
+        ]
 
 
 class FileAttachmentSerializer(serializers.ModelSerializer):
@@ -80,7 +106,16 @@ class FileAttachmentSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = FileAttachment
-        fields = "__all__"
+        fields = [
+            "id",
+            "created_at",
+            "updated_at",
+            "file",
+            "filename",
+            "file_type",
+            "file_size",
+            "user",
+        ]
         read_only_fields = ["user", "file_size"]
 
 
@@ -107,8 +142,8 @@ class MessageSerializer(serializers.ModelSerializer):
 class ConversationSerializer(serializers.ModelSerializer):
     """Serializer for conversations."""
 
-    participants = UserSerializer(many=True, read_only=True)
-    last_message = serializers.SerializerMethodField()
+    participants = UserSummarySerializer(many=True, read_only=True)
+    last_message = MessageSerializer(read_only=True)
     unread_count = serializers.SerializerMethodField()
 
     class Meta:
@@ -123,15 +158,11 @@ class ConversationSerializer(serializers.ModelSerializer):
             "created_at",
         ]
 
-    def get_last_message(self, obj):
-        """Get the last message in the conversation."""
-        last_message = obj.messages.last()
-        if last_message:
-            return MessageSerializer(last_message).data
-        return None
-
     def get_unread_count(self, obj):
         """Get the count of unread messages for the current user."""
+        if hasattr(obj, "unread_count"):
+            # Annotated by ConversationViewSet for the requesting user.
+            return obj.unread_count
         request = self.context.get("request")
         if request and request.user.is_authenticated:
             return (
@@ -167,7 +198,17 @@ class TimeSlotSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = TimeSlot
-        fields = "__all__"
+        fields = [
+            "id",
+            "instructor_name",
+            "created_at",
+            "updated_at",
+            "start_time",
+            "end_time",
+            "is_available",
+            "recurring",
+            "instructor",
+        ]
         read_only_fields = ["instructor"]
 
 
@@ -180,7 +221,22 @@ class BookingSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = Booking
-        fields = "__all__"
+        fields = [
+            "id",
+            "student_name",
+            "instructor_name",
+            "homestay_title",
+            "created_at",
+            "updated_at",
+            "start_date",
+            "end_date",
+            "status",
+            "total_amount",
+            "notes",
+            "student",
+            "instructor",
+            "homestay",
+        ]
         read_only_fields = ["student", "created_at", "updated_at"]
 
 
@@ -209,7 +265,18 @@ class NotificationSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = Notification
-        fields = "__all__"
+        fields = [
+            "id",
+            "created_at",
+            "updated_at",
+            "notification_type",
+            "title",
+            "message",
+            "is_read",
+            "related_object_id",
+            "related_content_type",
+            "user",
+        ]
         read_only_fields = ["user"]
 
 
@@ -218,7 +285,17 @@ class NotificationPreferenceSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = NotificationPreference
-        fields = "__all__"
+        fields = [
+            "id",
+            "created_at",
+            "updated_at",
+            "email_messages",
+            "email_bookings",
+            "email_payments",
+            "push_messages",
+            "push_bookings",
+            "user",
+        ]
         read_only_fields = ["user"]
 
 
@@ -19,7 +19,36 @@ class NotificationService:
         Returns:
             Notification: The created notification instance
         """
-        notification = Notification.objects.create(
+        notification = NotificationService._build_notification(
+            user, notification_type, title, message, related_object
+        )
+        notification.save()
+        return notification
+
+    @staticmethod
+    def send_bulk(notifications):
+        """
+        Send many notifications using batched INSERTs.
+
+        Args:
+            notifications: Iterable of dicts with the same keys as the
+                send_notification arguments (user, notification_type, title,
+                message and optionally related_object)
+
+        Returns:
+            list: The created notification instances
+        """
+        return Notification.objects.bulk_create(
+            [NotificationService._build_notification(**item) for item in notifications],
+            batch_size=500,
+        )
+
+    @staticmethod
+    def _build_notification(
+        user, notification_type, title, message, related_object=None
+    ):
+        """Return an unsaved notification for the given user and context."""
+        return Notification(
             user=user,
             notification_type=notification_type,
             title=title,
@@ -29,7 +58,6 @@ class NotificationService:
             if related_object
             else "",
         )
-        return notification
 
 
 class MessagingService:
@@ -65,10 +93,10 @@ class MessagingService:
         Returns:
             Message: The created message instance
         """
+        # The conversation snapshot is updated by core.signals.
         message = Message.objects.create(
             conversation=conversation, sender=sender, content=content
         )
-        conversation.save()
         return message
 
 
@@ -0,0 +1,53 @@
+from django.db.models import F, OuterRef, Q, Subquery
+from django.db.models.functions import Coalesce
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .cache import invalidate_available_timeslots
+from .models import Conversation, Message, TimeSlot
+
+
+def refresh_conversation_snapshots(condition):
+    """Recompute the last-message snapshot of matching conversations."""
+    latest = Message.objects.filter(conversation=OuterRef("pk")).order_by(
+        "-created_at", "-id"
+    )
+    Conversation.objects.filter(condition).update(
+        last_message=Subquery(latest.values("pk")[:1]),
+        last_message_at=Coalesce(
+            Subquery(latest.values("created_at")[:1]), F("created_at")
+        ),
+    )
+
+
+@receiver(post_save, sender=Message)
+def update_conversation_snapshot(sender, instance, created, **kwargs):
+    """Point the conversation's last-message snapshot at a new message."""
+    if created:
+        Conversation.objects.filter(pk=instance.conversation_id).update(
+            last_message=instance.pk,
+            last_message_at=instance.created_at,
+            updated_at=instance.created_at,
+        )
+    else:
+        # The snapshot references the row, so edited content shows up on its
+        # own; only a message moved between conversations needs a recompute.
+        refresh_conversation_snapshots(
+            Q(pk=instance.conversation_id) | Q(last_message=instance.pk)
+        )
+
+
+@receiver(post_delete, sender=Message)
+def drop_conversation_snapshot(sender, instance, origin=None, **kwargs):
+    """Fall back to the previous message when the newest one is deleted."""
+    if isinstance(origin, Conversation):
+        # The whole conversation is going away.
+        return
+    refresh_conversation_snapshots(Q(pk=instance.conversation_id))
+
+
+@receiver(post_save, sender=TimeSlot)
+@receiver(post_delete, sender=TimeSlot)
+def invalidate_timeslot_cache(sender, **kwargs):
+    """Drop cached availability pages whenever a time slot changes."""
+    invalidate_available_timeslots()
@@ -1,3 +1,124 @@
-from django.test import TestCase
+from django.core.cache import cache
+from django.test import SimpleTestCase, TestCase
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIRequestFactory
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from .models import Conversation, Message, User
+from .renderers import ORJSONRenderer
+from .serializers import MarkNotificationsReadSerializer
+from .throttles import LoginRateThrottle
+from .views import login_view
 
 # Create your tests here.
+
+
+class ORJSONRendererTests(SimpleTestCase):
+    """ORJSONRenderer output must match DRF's JSONRenderer."""
+
+    def assertRendersLikeJSONRenderer(self, data):
+        self.assertEqual(ORJSONRenderer().render(data), JSONRenderer().render(data))
+
+    def test_int_keyed_list_field_errors(self):
+        serializer = MarkNotificationsReadSerializer(
+            data={"notification_ids": ["abc", 1]}
+        )
+        self.assertFalse(serializer.is_valid())
+        self.assertIn(0, serializer.errors["notification_ids"])
+        self.assertRendersLikeJSONRenderer(serializer.errors)
+
+    def test_line_separators_are_escaped(self):
+        self.assertRendersLikeJSONRenderer({"text": "a\u2028b\u2029c"})
+
+
+class LoginRateThrottleTests(TestCase):
+    """The per-IP login limit must hold for authenticated requests too."""
+
+    def setUp(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+        self.factory = APIRequestFactory()
+
+    def login(self, email, **extra):
+        request = self.factory.post(
+            "/api/auth/login/",
+            {"email": email, "password": "wrong-password"},
+            format="json",
+            **extra,
+        )
+        return login_view(request)
+
+    def test_bearer_token_does_not_bypass_ip_limit(self):
+        user = User.objects.create_user(email="owner@example.com", password="pw")
+        token = RefreshToken.for_user(user).access_token
+        limit = LoginRateThrottle().num_requests
+
+        # A different email each time, so only the per-IP limit can trip.
+        statuses = [
+            self.login(
+                f"target{i}@example.com", HTTP_AUTHORIZATION=f"Bearer {token}"
+            ).status_code
+            for i in range(limit + 1)
+        ]
+
+        self.assertEqual(statuses[:limit], [400] * limit)
+        self.assertEqual(statuses[limit], 429)
+
+
+class ConversationSnapshotTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(email="sender@example.com")
+
+    def setUp(self):
+        self.conversation = Conversation.objects.create()
+        self.other = Conversation.objects.create()
+
+    def send(self, conversation, content):
+        return Message.objects.create(
+            conversation=conversation, sender=self.user, content=content
+        )
+
+    def assertSnapshot(self, conversation, message):
+        conversation.refresh_from_db()
+        self.assertEqual(conversation.last_message, message)
+        if message is not None:
+            self.assertEqual(conversation.last_message_at, message.created_at)
+
+    def test_create_sets_last_message(self):
+        self.send(self.conversation, "first")
+        second = self.send(self.conversation, "second")
+        self.assertSnapshot(self.conversation, second)
+
+    def test_edit_keeps_last_message(self):
+        message = self.send(self.conversation, "first")
+        message.content = "edited"
+        message.save()
+        self.assertSnapshot(self.conversation, message)
+        self.conversation.refresh_from_db()
+        self.assertEqual(self.conversation.last_message.content, "edited")
+
+    def test_move_updates_both_conversations(self):
+        first = self.send(self.conversation, "first")
+        moved = self.send(self.conversation, "moved")
+        moved.conversation = self.other
+        moved.save()
+        self.assertSnapshot(self.conversation, first)
+        self.assertSnapshot(self.other, moved)
+
+    def test_delete_newest_falls_back_to_previous(self):
+        first = self.send(self.conversation, "first")
+        self.send(self.conversation, "second").delete()
+        self.assertSnapshot(self.conversation, first)
+        first.delete()
+        self.assertSnapshot(self.conversation, None)
+        self.assertEqual(
+            self.conversation.last_message_at, self.conversation.created_at
+        )
+
+    def test_delete_conversation_cascades_to_messages(self):
+        self.send(self.conversation, "first")
+        kept = self.send(self.other, "kept")
+        self.conversation.delete()
+        self.assertFalse(Message.objects.exclude(pk=kept.pk).exists())
+        self.assertSnapshot(self.other, kept)
@@ -0,0 +1,34 @@
+from collections.abc import Mapping
+
+from rest_framework.throttling import SimpleRateThrottle
+
+
+class LoginRateThrottle(SimpleRateThrottle):
+    """Limit login attempts per client IP, authenticated or not."""
+
+    scope = "login"
+
+    def get_cache_key(self, request, view):
+        """Key the throttle on the client IP."""
+        # Unlike AnonRateThrottle, never skip authenticated requests: a token
+        # for one account must not lift the limit on guessing others.
+        return self.cache_format % {
+            "scope": self.scope,
+            "ident": self.get_ident(request),
+        }
+
+
+class LoginEmailRateThrottle(SimpleRateThrottle):
+    """Limit login attempts per target account, regardless of client IP."""
+
+    scope = "login_email"
+
+    def get_cache_key(self, request, view):
+        """Key the throttle on the submitted email address."""
+        # Runs before validation, so leave malformed bodies to the serializer.
+        if not isinstance(request.data, Mapping):
+            return None
+        email = request.data.get("email")
+        if not isinstance(email, str) or not email:
+            return None
+        return self.cache_format % {"scope": self.scope, "ident": email.lower()}
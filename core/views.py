@@ -1,9 +1,15 @@
+import hashlib
+
 from rest_framework import viewsets, status, generics, permissions
-from rest_framework.decorators import api_view, permission_classes, action
+from rest_framework.decorators import api_view, permission_classes, action, throttle_classes
 from rest_framework.response import Response
 from rest_framework_simplejwt.tokens import RefreshToken
 from django.contrib.auth import login
-from django.db.models import Q
+from django.core.cache import cache
+from django.http import Http404, StreamingHttpResponse
+from django.shortcuts import get_object_or_404
+from django.db import transaction
+from django.db.models import Count, Exists, F, OuterRef, Prefetch, Q
 from django.utils import timezone
 from .models import (
     User, Conversation, Message, Booking, TimeSlot, 
@@ -15,6 +21,14 @@ from .serializers import (
     BookingSerializer, TimeSlotSerializer, BookingCreateSerializer,
     NotificationSerializer, NotificationPreferenceSerializer, MarkNotificationsReadSerializer
 )
+from .cache import AVAILABLE_TIMESLOTS_TIMEOUT, available_timeslots_key
+from .pagination import (
+    ConversationCursorPagination,
+    MessageCursorPagination,
+    NotificationCursorPagination,
+)
+from .renderers import ORJSONRenderer
+from .throttles import LoginRateThrottle, LoginEmailRateThrottle
 
 
 class UserRegistrationView(generics.CreateAPIView):
@@ -31,19 +45,25 @@ class UserRegistrationView(generics.CreateAPIView):
 
 @api_view(['POST'])
 @permission_classes([permissions.AllowAny])
+@throttle_classes([LoginRateThrottle, LoginEmailRateThrottle])
 def login_view(request):
     """
     API view for user login.
     
     Authenticates users with email and password.
     Returns user data and JWT tokens upon successful authentication.
+    Attempts are throttled per IP and per email, since each one runs
+    the password hasher. Clients should keep sessions alive through
+    token/refresh/ rather than logging in again.
     """
     serializer = LoginSerializer(data=request.data)
     if serializer.is_valid():
         user = serializer.validated_data['user']
-    refresh = RefreshToken.for_user(user)
+        refresh = RefreshToken.for_user(user)
+        # Carried into every access token minted from this refresh token.
+        refresh['role'] = user.role
         
-    return Response({
+        return Response({
             'user': UserSerializer(user).data,
             'refresh': str(refresh),
             'access': str(refresh.access_token),
@@ -91,11 +111,31 @@ class ConversationViewSet(viewsets.ModelViewSet):
     """
     serializer_class = ConversationSerializer
     permission_classes = [permissions.IsAuthenticated]
+    pagination_class = ConversationCursorPagination
     
     def get_queryset(self):
         """Return conversations where the current user is a participant."""
         user = self.request.user
-        return Conversation.objects.filter(participants=user).prefetch_related('participants', 'messages')
+        queryset = Conversation.objects.filter(participants=user)
+        if self.action in ('messages', 'export'):
+            # The action only needs the membership check, not the inbox summary.
+            return queryset
+        
+        participants = Prefetch(
+            'participants', queryset=User.objects.only('id', 'name', 'avatar')
+        )
+        unread_count = Count(
+            'messages',
+            filter=Q(messages__is_read=False) & ~Q(messages__sender=user),
+        )
+        return (
+            queryset
+            .annotate(unread_count=unread_count)
+            .select_related('last_message__sender')
+            .prefetch_related(participants)
+            # Meta.ordering is not applied to aggregated querysets.
+            .order_by('-last_message_at')
+        )
     
     def get_serializer_class(self):
         """Return appropriate serializer based on action."""
@@ -108,7 +148,7 @@ class ConversationViewSet(viewsets.ModelViewSet):
         conversation = serializer.save()
         conversation.participants.add(self.request.user)
     
-    @action(detail=True, methods=['get'])
+    @action(detail=True, methods=['get'], pagination_class=MessageCursorPagination)
     def messages(self, request, pk=None):
         """
         Retrieve messages for a specific conversation.
@@ -116,7 +156,7 @@ class ConversationViewSet(viewsets.ModelViewSet):
         Returns paginated list of messages in the conversation.
         """
         conversation = self.get_object()
-        messages = conversation.messages.all().select_related('sender')
+        messages = Message.objects.filter(conversation=conversation).select_related('sender')
         page = self.paginate_queryset(messages)
         
         if page is not None:
@@ -126,6 +166,29 @@ class ConversationViewSet(viewsets.ModelViewSet):
         serializer = MessageSerializer(messages, many=True)
         return Response(serializer.data)
     
+    @action(detail=True, methods=['get'])
+    def export(self, request, pk=None):
+        """
+        Stream every message in a conversation as newline-delimited JSON.
+        
+        Rows are fetched in chunks, so memory stays flat however long
+        the conversation is.
+        """
+        conversation = self.get_object()
+        rows = (
+            Message.objects.filter(conversation=conversation)
+            .order_by('created_at', 'id')
+            .values(
+                'id', 'conversation', 'sender', 'content', 'is_read', 'read_at',
+                'created_at', sender_name=F('sender__name'),
+            )
+            .iterator(chunk_size=500)
+        )
+        # Same keys and encoding as MessageSerializer output from messages/.
+        renderer = ORJSONRenderer()
+        lines = (renderer.render(row) + b'\n' for row in rows)
+        return StreamingHttpResponse(lines, content_type='application/x-ndjson')
+    
     @action(detail=False, methods=['get'])
     def direct_chat(self, request):
         """
@@ -136,15 +199,22 @@ class ConversationViewSet(viewsets.ModelViewSet):
         other_user_id = request.query_params.get('user_id')
         if not other_user_id:
             return Response({'error': 'user_id parameter required'}, status=status.HTTP_400_BAD_REQUEST)
+        try:
+            other_user_id = int(other_user_id)
+        except ValueError:
+            return Response({'error': 'user_id must be an integer'}, status=status.HTTP_400_BAD_REQUEST)
         
         user = request.user
-        other_user = User.objects.get(id=other_user_id)
+        other_user = get_object_or_404(User.objects.only('id', 'name'), id=other_user_id)
         
-        conversation = Conversation.objects.filter(
-            participants=user
-        ).filter(
-            participants=other_user
-        ).first()
+        other_membership = Conversation.participants.through.objects.filter(
+            conversation=OuterRef('pk'), user=other_user
+        )
+        conversation = (
+            Conversation.objects.filter(participants=user)
+            .filter(Exists(other_membership))
+            .first()
+        )
         
         if not conversation:
             conversation = Conversation.objects.create(title=f"Chat with {other_user.name}")
@@ -171,14 +241,14 @@ class MessageViewSet(viewsets.ModelViewSet):
             conversation__participants=user
         ).select_related('sender', 'conversation')
     
+    @transaction.atomic
     def perform_create(self, serializer):
         """Mark other messages as read when sending a new message."""
         message = serializer.save(sender=self.request.user)
         conversation = message.conversation
         conversation.messages.filter(is_read=False).exclude(
             sender=self.request.user
-        ).update(is_read=True)
-        conversation.save()
+        ).update(is_read=True, read_at=timezone.now())
 
 
 class TimeSlotViewSet(viewsets.ModelViewSet):
@@ -195,8 +265,30 @@ class TimeSlotViewSet(viewsets.ModelViewSet):
         """Return time slots based on user role."""
         user = self.request.user
         if user.role == 'INSTRUCTOR':
-            return TimeSlot.objects.filter(instructor=user)
-        return TimeSlot.objects.filter(is_available=True, start_time__gte=timezone.now())
+            return TimeSlot.objects.select_related('instructor').filter(instructor=user)
+        return TimeSlot.objects.select_related('instructor').filter(
+            is_available=True, start_time__gte=timezone.now()
+        )
+    
+    def list(self, request, *args, **kwargs):
+        """
+        List time slots.
+        
+        The students' availability view is shared by everyone, so each page
+        is cached briefly and dropped whenever a time slot changes.
+        """
+        if request.user.role == 'INSTRUCTOR':
+            return super().list(request, *args, **kwargs)
+        
+        url = hashlib.md5(
+            request.build_absolute_uri().encode(), usedforsecurity=False
+        ).hexdigest()
+        key = available_timeslots_key(url)
+        data = cache.get(key)
+        if data is None:
+            data = super().list(request, *args, **kwargs).data
+            cache.set(key, data, AVAILABLE_TIMESLOTS_TIMEOUT)
+        return Response(data)
     
     def perform_create(self, serializer):
         """Ensure only instructors can create time slots."""
@@ -218,11 +310,12 @@ class BookingViewSet(viewsets.ModelViewSet):
     def get_queryset(self):
         """Return bookings based on user role."""
         user = self.request.user
+        queryset = Booking.objects.select_related('student', 'instructor', 'homestay')
         if user.role == 'STUDENT':
-            return Booking.objects.filter(student=user)
+            return queryset.filter(student=user)
         elif user.role == 'INSTRUCTOR':
-            return Booking.objects.filter(instructor=user)
-        return Booking.objects.all()
+            return queryset.filter(instructor=user)
+        return queryset
     
     def get_serializer_class(self):
         """Return appropriate serializer based on action."""
@@ -230,6 +323,25 @@ class BookingViewSet(viewsets.ModelViewSet):
             return BookingCreateSerializer
         return BookingSerializer
     
+    def update_status(self, owner_filter, new_status):
+        """
+        Move the requested booking to new_status in a single UPDATE.
+        
+        Returns whether the booking changed; raises Http404 if it is not
+        one of the caller's bookings.
+        """
+        try:
+            pk = int(self.kwargs[self.lookup_field])
+        except ValueError:
+            raise Http404
+        
+        updated = Booking.objects.filter(owner_filter, pk=pk).update(
+            status=new_status, updated_at=timezone.now()
+        )
+        if not updated and not self.get_queryset().filter(pk=pk).exists():
+            raise Http404
+        return bool(updated)
+    
     @action(detail=True, methods=['post'])
     def confirm(self, request, pk=None):
         """
@@ -237,12 +349,9 @@ class BookingViewSet(viewsets.ModelViewSet):
         
         Only the instructor can confirm their bookings.
         """
-        booking = self.get_object()
-        if booking.instructor != request.user:
+        if not self.update_status(Q(instructor=request.user), 'confirmed'):
             return Response({'error': 'Not authorized'}, status=status.HTTP_403_FORBIDDEN)
         
-        booking.status = 'confirmed'
-        booking.save()
         return Response({'status': 'booking confirmed'})
     
     @action(detail=True, methods=['post'])
@@ -252,12 +361,10 @@ class BookingViewSet(viewsets.ModelViewSet):
         
         Both student and instructor can cancel bookings.
         """
-        booking = self.get_object()
-        if booking.student != request.user and booking.instructor != request.user:
+        user = request.user
+        if not self.update_status(Q(student=user) | Q(instructor=user), 'cancelled'):
             return Response({'error': 'Not authorized'}, status=status.HTTP_403_FORBIDDEN)
         
-        booking.status = 'cancelled'
-        booking.save()
         return Response({'status': 'booking cancelled'})
 
 
@@ -270,11 +377,28 @@ class NotificationViewSet(viewsets.ModelViewSet):
     """
     serializer_class = NotificationSerializer
     permission_classes = [permissions.IsAuthenticated]
+    pagination_class = NotificationCursorPagination
     
     def get_queryset(self):
         """Return notifications for the current user."""
         return Notification.objects.filter(user=self.request.user)
     
+    def list(self, request, *args, **kwargs):
+        """
+        List notifications for the current user.
+        
+        Notifications are plain column data, so rows are read with values()
+        and returned directly instead of building model instances and
+        running them through the serializer.
+        """
+        queryset = self.filter_queryset(self.get_queryset()).values(
+            *NotificationSerializer.Meta.fields
+        )
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(page)
+        return Response(list(queryset))
+    
     def perform_create(self, serializer):
         """Associate notification with current user."""
         serializer.save(user=self.request.user)
@@ -284,16 +408,18 @@ class NotificationViewSet(viewsets.ModelViewSet):
         """
         Mark multiple notifications as read.
         
-        Requires notification_ids list in request data.
+        Requires notification_ids list in request data. Notifications that
+        were already read are skipped and not counted in the response.
         """
         serializer = MarkNotificationsReadSerializer(data=request.data)
         if serializer.is_valid():
             notification_ids = serializer.validated_data['notification_ids']
-            Notification.objects.filter(
+            updated = Notification.objects.filter(
                 id__in=notification_ids, 
-                user=request.user
+                user=request.user,
+                is_read=False
             ).update(is_read=True)
-            return Response({'status': 'notifications marked as read'})
+            return Response({'status': 'notifications marked as read', 'updated': updated})
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
     @action(detail=False, methods=['get'])
@@ -319,5 +445,7 @@ class NotificationPreferenceViewSet(viewsets.ModelViewSet):
         return NotificationPreference.objects.filter(user=self.request.user)
     
     def perform_create(self, serializer):
-        """Associate preferences with current user."""
-        serializer.save(user=self.request.user)
+        """Create or update the current user's preferences in one upsert."""
+        serializer.instance, _ = NotificationPreference.objects.update_or_create(
+            user=self.request.user, defaults=serializer.validated_data
+        )
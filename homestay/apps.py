@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class HomestayConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "homestay"
+
+    def ready(self):
+        from . import signals  # noqa: F401
@@ -0,0 +1,19 @@
+# Generated by Django 4.2.30 on 2026-10-15 21:50
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("homestay", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="homestay",
+            index=models.Index(
+                fields=["host", "is_active"], name="homestay_host_id_74fcb2_idx"
+            ),
+        ),
+    ]
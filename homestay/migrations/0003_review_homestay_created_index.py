@@ -0,0 +1,20 @@
+# Generated by Django 4.2.30 on 2026-10-15 21:51
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("homestay", "0002_role_filter_indexes"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="homestayreview",
+            index=models.Index(
+                fields=["homestay", "-created_at", "-id"],
+                name="homestay_re_homesta_d19bee_idx",
+            ),
+        ),
+    ]
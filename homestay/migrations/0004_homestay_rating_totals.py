@@ -0,0 +1,44 @@
+# Generated by Django 4.2.30 on 2026-10-15 21:54
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery, Sum
+from django.db.models.functions import Coalesce
+
+
+def backfill_rating_totals(apps, schema_editor):
+    Homestay = apps.get_model("homestay", "Homestay")
+    HomestayReview = apps.get_model("homestay", "HomestayReview")
+    reviews = (
+        HomestayReview.objects.filter(homestay=OuterRef("pk"))
+        .order_by()
+        .values("homestay")
+    )
+    Homestay.objects.update(
+        rating_sum=Coalesce(
+            Subquery(reviews.annotate(total=Sum("rating")).values("total")), 0
+        ),
+        rating_count=Coalesce(
+            Subquery(reviews.annotate(total=Count("pk")).values("total")), 0
+        ),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("homestay", "0003_review_homestay_created_index"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="homestay",
+            name="rating_count",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="homestay",
+            name="rating_sum",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.RunPython(backfill_rating_totals, migrations.RunPython.noop),
+    ]
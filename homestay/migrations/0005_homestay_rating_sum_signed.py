@@ -0,0 +1,18 @@
+# Generated by Django 4.2.30 on 2026-10-15 22:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("homestay", "0004_homestay_rating_totals"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="homestay",
+            name="rating_sum",
+            field=models.IntegerField(default=0),
+        ),
+    ]
@@ -13,9 +13,20 @@ class Homestay(TimeStampedModel):
     max_guests = models.IntegerField(default=1)
     amenities = models.JSONField(default=dict)
     is_active = models.BooleanField(default=True)
+    # Review totals, kept in step with HomestayReview by homestay.signals.
+    rating_sum = models.IntegerField(default=0)
+    rating_count = models.PositiveIntegerField(default=0)
 
     class Meta:
         db_table = "homestay"
+        indexes = [models.Index(fields=["host", "is_active"])]
+
+    @property
+    def average_rating(self):
+        """Return the mean review rating, or 0.0 without reviews."""
+        if not self.rating_count:
+            return 0.0
+        return self.rating_sum / self.rating_count
 
 
 class HomestayImage(TimeStampedModel):
@@ -45,3 +56,4 @@ class HomestayReview(TimeStampedModel):
     class Meta:
         db_table = "homestay_review"
         unique_together = ["homestay", "student"]
+        indexes = [models.Index(fields=["homestay", "-created_at", "-id"])]
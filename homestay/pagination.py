@@ -0,0 +1,8 @@
+from rest_framework.pagination import CursorPagination
+
+
+class ReviewCursorPagination(CursorPagination):
+    """Keyset pagination for homestay reviews, newest first."""
+
+    ordering = ("-created_at", "-id")
+    page_size = 20
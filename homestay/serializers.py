@@ -1,5 +1,7 @@
 from rest_framework import serializers
+from django.db import transaction
 from .models import Homestay, HomestayImage, HomestayReview
+from core.models import Location
 from core.serializers import LocationSerializer, UserSerializer
 
 
@@ -10,6 +12,25 @@ class HomestayImageSerializer(serializers.ModelSerializer):
         model = HomestayImage
         fields = "__all__"
 
+    def get_fields(self):
+        """Only accept homestays owned by the requesting user."""
+        fields = super().get_fields()
+        request = self.context.get("request")
+        if request is not None:
+            fields["homestay"].queryset = Homestay.objects.filter(host=request.user)
+        return fields
+
+
+class HomestayImageBulkSerializer(serializers.Serializer):
+    """Serializer for uploading several images to one homestay."""
+
+    homestay = serializers.IntegerField()
+    images = serializers.ListField(child=serializers.ImageField(), allow_empty=False)
+    captions = serializers.ListField(
+        child=serializers.CharField(max_length=200, allow_blank=True),
+        required=False,
+    )
+
 
 class HomestayReviewSerializer(serializers.ModelSerializer):
     """Serializer for homestay reviews."""
@@ -21,6 +42,14 @@ class HomestayReviewSerializer(serializers.ModelSerializer):
         fields = "__all__"
         read_only_fields = ["student"]
 
+    def validate_homestay(self, value):
+        """Keep existing reviews attached to the homestay they rate."""
+        if self.instance is not None and value.pk != self.instance.homestay_id:
+            raise serializers.ValidationError(
+                "A review cannot be moved to another homestay."
+            )
+        return value
+
 
 class HomestaySerializer(serializers.ModelSerializer):
     """Serializer for homestay data."""
@@ -29,19 +58,39 @@ class HomestaySerializer(serializers.ModelSerializer):
     location = LocationSerializer()
     images = HomestayImageSerializer(many=True, read_only=True)
     reviews = HomestayReviewSerializer(many=True, read_only=True)
-    average_rating = serializers.SerializerMethodField()
+    average_rating = serializers.FloatField(read_only=True)
 
     class Meta:
         model = Homestay
-        fields = "__all__"
+        exclude = ["rating_sum", "rating_count"]
         read_only_fields = ["host"]
 
-    def get_average_rating(self, obj):
-        """Calculate average rating from reviews."""
-        reviews = obj.reviews.all()
-        if reviews:
-            return sum(review.rating for review in reviews) / len(reviews)
-        return 0
+
+class HomestayListSerializer(serializers.ModelSerializer):
+    """Compact serializer for homestay list items."""
+
+    city = serializers.CharField(source="location.city", read_only=True)
+    primary_image = serializers.SerializerMethodField()
+    average_rating = serializers.FloatField(read_only=True)
+
+    class Meta:
+        model = Homestay
+        fields = [
+            "id",
+            "title",
+            "price_per_night",
+            "city",
+            "primary_image",
+            "average_rating",
+        ]
+
+    def get_primary_image(self, obj):
+        """Return the URL of the annotated primary image, if any."""
+        if not obj.primary_image:
+            return None
+        url = HomestayImage._meta.get_field("image").storage.url(obj.primary_image)
+        request = self.context.get("request")
+        return request.build_absolute_uri(url) if request else url
 
 
 class HomestayCreateSerializer(serializers.ModelSerializer):
@@ -60,8 +109,9 @@ class HomestayCreateSerializer(serializers.ModelSerializer):
             "amenities",
         ]
 
+    @transaction.atomic
     def create(self, validated_data):
-        """Create homestay with location."""
+        """Create homestay with location in a single transaction."""
         location_data = validated_data.pop("location")
         location = Location.objects.create(**location_data)
 
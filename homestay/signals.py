@@ -0,0 +1,33 @@
+from django.db import transaction
+from django.db.models import Count, OuterRef, Subquery, Sum
+from django.db.models.functions import Coalesce
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import Homestay, HomestayReview
+
+
+@receiver(post_save, sender=HomestayReview)
+@receiver(post_delete, sender=HomestayReview)
+def update_rating_totals(sender, instance, **kwargs):
+    """Recompute the reviewed homestay's rating totals from its reviews."""
+    homestay = Homestay.objects.filter(pk=instance.homestay_id)
+    reviews = (
+        HomestayReview.objects.filter(homestay=OuterRef("pk"))
+        .order_by()
+        .values("homestay")
+    )
+    with transaction.atomic():
+        # Lock the row first: the UPDATE below then starts after any
+        # concurrent review write has committed, so its subqueries see that
+        # review too. NO KEY keeps the lock compatible with the KEY SHARE
+        # locks taken by review inserts' foreign key checks.
+        list(homestay.select_for_update(no_key=True).values_list("pk", flat=True))
+        homestay.update(
+            rating_sum=Coalesce(
+                Subquery(reviews.annotate(total=Sum("rating")).values("total")), 0
+            ),
+            rating_count=Coalesce(
+                Subquery(reviews.annotate(total=Count("pk")).values("total")), 0
+            ),
+        )
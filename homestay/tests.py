@@ -1,3 +1,62 @@
 from django.test import TestCase
 
-# Create your tests here.
+from core.models import Location, User
+
+from .models import Homestay, HomestayReview
+
+
+class RatingTotalsTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        host = User.objects.create_user(email="host@example.com", name="Host")
+        location = Location.objects.create(
+            address="1 Main St",
+            city="Town",
+            state="State",
+            country="Country",
+            postal_code="00000",
+        )
+        cls.homestay = Homestay.objects.create(
+            host=host,
+            title="Homestay",
+            description="",
+            location=location,
+            price_per_night=50,
+        )
+        cls.students = [
+            User.objects.create_user(email=f"s{i}@example.com", name=f"S{i}")
+            for i in range(2)
+        ]
+
+    def review(self, student, rating):
+        return HomestayReview.objects.create(
+            homestay=self.homestay, student=student, rating=rating, comment=""
+        )
+
+    def assertTotals(self, rating_sum, rating_count):
+        self.homestay.refresh_from_db()
+        self.assertEqual(
+            (self.homestay.rating_sum, self.homestay.rating_count),
+            (rating_sum, rating_count),
+        )
+
+    def test_create_adds_to_totals(self):
+        self.review(self.students[0], 4)
+        self.review(self.students[1], 5)
+        self.assertTotals(9, 2)
+        self.assertEqual(self.homestay.average_rating, 4.5)
+
+    def test_update_replaces_old_rating(self):
+        review = self.review(self.students[0], 2)
+        review.rating = 5
+        review.save()
+        self.assertTotals(5, 1)
+
+    def test_delete_removes_from_totals(self):
+        review = self.review(self.students[0], 4)
+        self.review(self.students[1], 2)
+        review.delete()
+        self.assertTotals(2, 1)
+        HomestayReview.objects.all().delete()
+        self.assertTotals(0, 0)
+        self.assertEqual(self.homestay.average_rating, 0.0)
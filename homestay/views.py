@@ -1,9 +1,16 @@
-from rest_framework import viewsets, permissions
-from django.db.models import Avg
+from rest_framework import viewsets, permissions, status
+from rest_framework.decorators import action
+from rest_framework.response import Response
+from django.db import transaction
+from django.shortcuts import get_object_or_404
+from django.db.models import OuterRef, Prefetch, Subquery
 from .models import Homestay, HomestayImage, HomestayReview
+from .pagination import ReviewCursorPagination
 from .serializers import (
     HomestaySerializer,
+    HomestayListSerializer,
     HomestayImageSerializer,
+    HomestayImageBulkSerializer,
     HomestayReviewSerializer,
     HomestayCreateSerializer,
 )
@@ -23,11 +30,23 @@ class HomestayViewSet(viewsets.ModelViewSet):
     def get_queryset(self):
         """Return homestays based on user role and filters."""
         user = self.request.user
-        queryset = (
-            Homestay.objects.filter(is_active=True)
-            .select_related("host", "location")
-            .prefetch_related("images", "reviews")
-        )
+        queryset = Homestay.objects.filter(is_active=True).select_related("location")
+
+        if self.action == "list":
+            primary_image = HomestayImage.objects.filter(
+                homestay=OuterRef("pk"), is_primary=True
+            ).values("image")[:1]
+            queryset = queryset.annotate(primary_image=Subquery(primary_image)).defer(
+                "description", "amenities", "location__address"
+            )
+        else:
+            queryset = queryset.select_related("host").prefetch_related(
+                "images",
+                Prefetch(
+                    "reviews",
+                    queryset=HomestayReview.objects.select_related("student"),
+                ),
+            )
 
         if user.role == "INSTRUCTOR":
             queryset = queryset.filter(host=user)
@@ -42,6 +61,8 @@ class HomestayViewSet(viewsets.ModelViewSet):
         """Return appropriate serializer based on action."""
         if self.action == "create":
             return HomestayCreateSerializer
+        if self.action == "list":
+            return HomestayListSerializer
         return HomestaySerializer
 
     def perform_create(self, serializer):
@@ -65,15 +86,37 @@ class HomestayImageViewSet(viewsets.ModelViewSet):
         """Return images for homestays owned by current user."""
         return HomestayImage.objects.filter(homestay__host=self.request.user)
 
-    def perform_create(self, serializer):
-        """Ensure user can only add images to their own homestays."""
-        homestay_id = self.request.data.get("homestay")
-        homestay = Homestay.objects.get(id=homestay_id)
+    @action(detail=False, methods=["post"])
+    def bulk(self, request):
+        """
+        Upload several images to one of the user's homestays at once.
 
-        if homestay.host != self.request.user:
-            raise PermissionError("You can only add images to your own homestays")
+        Expects a homestay id, one or more images and optional captions
+        matched to the images by position.
+        """
+        serializer = HomestayImageBulkSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
 
-        serializer.save()
+        homestay = get_object_or_404(
+            Homestay.objects.only("id"), id=data["homestay"], host=request.user
+        )
+        captions = data.get("captions", [])
+        images = HomestayImage.objects.bulk_create(
+            [
+                HomestayImage(
+                    homestay=homestay,
+                    image=image,
+                    caption=captions[i] if i < len(captions) else "",
+                )
+                for i, image in enumerate(data["images"])
+            ],
+            batch_size=100,
+        )
+        output = HomestayImageSerializer(
+            images, many=True, context=self.get_serializer_context()
+        )
+        return Response(output.data, status=status.HTTP_201_CREATED)
 
 
 class HomestayReviewViewSet(viewsets.ModelViewSet):
@@ -85,16 +128,32 @@ class HomestayReviewViewSet(viewsets.ModelViewSet):
 
     serializer_class = HomestayReviewSerializer
     permission_classes = [permissions.IsAuthenticated]
+    pagination_class = ReviewCursorPagination
+    filterset_fields = ["homestay"]
 
     def get_queryset(self):
         """Return reviews based on user role."""
         user = self.request.user
+        queryset = HomestayReview.objects.select_related("student")
         if user.role == "STUDENT":
-            return HomestayReview.objects.filter(student=user)
-        return HomestayReview.objects.all()
+            return queryset.filter(student=user)
+        return queryset
 
+    # Review writes also update the homestay's rating totals (see
+    # homestay.signals); run both in one transaction.
+    @transaction.atomic
     def perform_create(self, serializer):
         """Ensure only students can create reviews."""
         if self.request.user.role != "STUDENT":
             raise PermissionError("Only students can create reviews")
         serializer.save(student=self.request.user)
+
+    @transaction.atomic
+    def perform_update(self, serializer):
+        """Save the review together with its homestay's rating totals."""
+        super().perform_update(serializer)
+
+    @transaction.atomic
+    def perform_destroy(self, instance):
+        """Delete the review together with its homestay's rating totals."""
+        super().perform_destroy(instance)
@@ -1,3 +1,22 @@
 from django.contrib import admin
 
-# Register your models here.
+from .models import StudentProfile, StudentProgress
+
+
+@admin.register(StudentProfile)
+class StudentProfileAdmin(admin.ModelAdmin):
+    """Admin configuration for student profiles."""
+
+    list_display = ["user", "date_of_birth", "created_at"]
+    search_fields = ["user__email", "user__name"]
+    list_select_related = ["user"]
+
+
+@admin.register(StudentProgress)
+class StudentProgressAdmin(admin.ModelAdmin):
+    """Admin configuration for student progress records."""
+
+    list_display = ["student", "lesson", "completed", "score", "last_accessed"]
+    list_filter = ["completed"]
+    search_fields = ["student__email", "lesson__title"]
+    list_select_related = ["student", "lesson"]
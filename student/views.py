@@ -17,9 +17,10 @@ class StudentProfileViewSet(viewsets.ModelViewSet):
     def get_queryset(self):
         """Return student profiles based on user role."""
         user = self.request.user
+        queryset = StudentProfile.objects.select_related("user")
         if user.role == "STUDENT":
-            return StudentProfile.objects.filter(user=user)
-        return StudentProfile.objects.all()
+            return queryset.filter(user=user)
+        return queryset
 
     def perform_create(self, serializer):
         """Ensure only students can create student profiles."""
@@ -42,9 +43,10 @@ class StudentProgressViewSet(viewsets.ModelViewSet):
     def get_queryset(self):
         """Return student progress based on user role."""
         user = self.request.user
+        queryset = StudentProgress.objects.select_related("lesson")
         if user.role == "STUDENT":
-            return StudentProgress.objects.filter(student=user)
-        return StudentProgress.objects.all()
+            return queryset.filter(student=user)
+        return queryset
 
     def perform_create(self, serializer):
         """Ensure only students can create progress records."""
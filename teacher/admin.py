@@ -1,3 +1,59 @@
 from django.contrib import admin
+from django.db.models import Count
 
-# Register your models here.
+from core.admin import ChangedFieldsAdminMixin
+from .models import Course, Lesson, TeacherProfile
+
+
+@admin.register(Course)
+class CourseAdmin(ChangedFieldsAdminMixin, admin.ModelAdmin):
+    """Admin configuration for courses."""
+
+    list_display = [
+        "title",
+        "teacher",
+        "status",
+        "price",
+        "lessons_count",
+        "created_at",
+    ]
+    list_filter = ["status"]
+    search_fields = ["title", "teacher__email"]
+    list_select_related = ["teacher"]
+
+    def get_queryset(self, request):
+        """Annotate lesson counts and skip the description column."""
+        return (
+            super()
+            .get_queryset(request)
+            .annotate(_lessons_count=Count("lessons"))
+            .defer("description")
+        )
+
+    @admin.display(description="Lessons", ordering="_lessons_count")
+    def lessons_count(self, obj):
+        """Return the annotated number of lessons in the course."""
+        return obj._lessons_count
+
+
+@admin.register(Lesson)
+class LessonAdmin(ChangedFieldsAdminMixin, admin.ModelAdmin):
+    """Admin configuration for lessons."""
+
+    list_display = ["title", "course", "order", "is_published"]
+    list_filter = ["is_published", "course__status"]
+    search_fields = ["title", "course__title"]
+    list_select_related = ["course"]
+
+    def get_queryset(self, request):
+        """Skip the lesson body, which the changelist never displays."""
+        return super().get_queryset(request).defer("content")
+
+
+@admin.register(TeacherProfile)
+class TeacherProfileAdmin(admin.ModelAdmin):
+    """Admin configuration for teacher profiles."""
+
+    list_display = ["user", "experience_years", "hourly_rate", "created_at"]
+    search_fields = ["user__email", "user__name"]
+    list_select_related = ["user"]
@@ -0,0 +1,27 @@
+# Generated by Django 4.2.30 on 2026-10-15 21:41
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("teacher", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="course",
+            name="status",
+            field=models.CharField(
+                choices=[
+                    ("draft", "Draft"),
+                    ("published", "Published"),
+                    ("archived", "Archived"),
+                ],
+                db_index=True,
+                default="draft",
+                max_length=20,
+            ),
+        ),
+    ]
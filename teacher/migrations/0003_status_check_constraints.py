@@ -0,0 +1,20 @@
+# Generated by Django 4.2.30 on 2026-10-15 21:42
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("teacher", "0002_course_status_index"),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name="course",
+            constraint=models.CheckConstraint(
+                check=models.Q(("status__in", ["draft", "published", "archived"])),
+                name="course_status_valid",
+            ),
+        ),
+    ]
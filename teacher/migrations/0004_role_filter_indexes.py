@@ -0,0 +1,19 @@
+# Generated by Django 4.2.30 on 2026-10-15 21:50
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("teacher", "0003_status_check_constraints"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="lesson",
+            index=models.Index(
+                fields=["is_published", "order"], name="lesson_is_publ_235a34_idx"
+            ),
+        ),
+    ]
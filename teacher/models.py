@@ -1,25 +1,38 @@
 from django.db import models
 from core.models import TimeStampedModel, User, Location
 
+COURSE_STATUS_CHOICES = (
+    ("draft", "Draft"),
+    ("published", "Published"),
+    ("archived", "Archived"),
+)
+
 
 class Course(TimeStampedModel):
     """Course model for teacher courses."""
 
-    STATUS_CHOICES = (
-        ("draft", "Draft"),
-        ("published", "Published"),
-        ("archived", "Archived"),
-    )
-
     teacher = models.ForeignKey(User, on_delete=models.CASCADE, related_name="courses")
     title = models.CharField(max_length=200)
     description = models.TextField()
     price = models.DecimalField(max_digits=8, decimal_places=2)
-    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default="draft")
+    status = models.CharField(
+        max_length=20, choices=COURSE_STATUS_CHOICES, default="draft", db_index=True
+    )
     thumbnail = models.ImageField(upload_to="course_thumbnails/", null=True, blank=True)
 
     class Meta:
         db_table = "course"
+        constraints = [
+            models.CheckConstraint(
+                check=models.Q(
+                    status__in=[value for value, _ in COURSE_STATUS_CHOICES]
+                ),
+                name="course_status_valid",
+            ),
+        ]
+
+    def __str__(self):
+        return self.title
 
 
 class Lesson(TimeStampedModel):
@@ -34,6 +47,15 @@ class Lesson(TimeStampedModel):
     class Meta:
         db_table = "lesson"
         ordering = ["order"]
+        indexes = [
+            models.Index(fields=["course", "order"]),
+            models.Index(fields=["is_published", "order"]),
+        ]
+
+    def __str__(self):
+        # Deliberately avoid self.course: rendering a lesson (admin widgets,
+        # progress changelists) should never lazily load its parent row.
+        return self.title
 
 
 class TeacherProfile(TimeStampedModel):
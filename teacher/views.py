@@ -1,4 +1,5 @@
 from rest_framework import viewsets, permissions
+from django.db.models import Count, Prefetch
 from .models import Course, Lesson, TeacherProfile
 from .serializers import CourseSerializer, LessonSerializer, TeacherProfileSerializer
 
@@ -17,9 +18,10 @@ class TeacherProfileViewSet(viewsets.ModelViewSet):
     def get_queryset(self):
         """Return teacher profiles based on user role."""
         user = self.request.user
+        queryset = TeacherProfile.objects.select_related("user")
         if user.role == "INSTRUCTOR":
-            return TeacherProfile.objects.filter(user=user)
-        return TeacherProfile.objects.all()
+            return queryset.filter(user=user)
+        return queryset
 
     def perform_create(self, serializer):
         """Ensure only instructors can create teacher profiles."""
@@ -42,9 +44,16 @@ class CourseViewSet(viewsets.ModelViewSet):
     def get_queryset(self):
         """Return courses based on user role."""
         user = self.request.user
+        queryset = (
+            Course.objects.select_related("teacher")
+            .prefetch_related(
+                Prefetch("lessons", queryset=Lesson.objects.order_by("order"))
+            )
+            .annotate(lessons_count=Count("lessons"))
+        )
         if user.role == "INSTRUCTOR":
-            return Course.objects.filter(teacher=user)
-        return Course.objects.filter(status="published")
+            return queryset.filter(teacher=user)
+        return queryset.filter(status="published")
 
     def perform_create(self, serializer):
         """Ensure only instructors can create courses."""